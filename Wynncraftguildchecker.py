@@ -9,7 +9,9 @@ import db
 import concurrent.futures
 from rate_limit_manager import rate_limit_manager
 import signal
+import gzip
 from functools import wraps
+from operator import itemgetter
 
 # Cache expiration time (in hours)
 CACHE_EXPIRATION_HOURS = 48
@@ -20,11 +22,37 @@ CACHE_REFRESH_INTERVAL_MINUTES = 5
 # Base URL for the loot API
 LOOT_API_BASE_URL = "https://nori.fish"
 
+# Responses smaller than this (in bytes) are sent uncompressed
+GZIP_MIN_SIZE = 1024
+
+# gzip level for JSON responses; level 1 is much faster and nearly as small on repetitive JSON
+GZIP_COMPRESS_LEVEL = 1
+
 # Ensure static folder is found correctly by using absolute path
 basedir = os.path.abspath(os.path.dirname(__file__))
 app = Flask(__name__, static_folder=os.path.join(basedir, 'public'))
 
 
+@app.after_request
+def gzip_json_response(response):
+    """Gzip large JSON responses when the client accepts it"""
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers
+            or response.mimetype != 'application/json'
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=GZIP_COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 class TimeoutError(Exception):
     """Custom timeout exception"""
     pass
@@ -161,23 +189,32 @@ def get_guild_details(guild_name, identifier=None):
         print(f"Error fetching guild details for {guild_name}: {e}")
         return None
 
-def check_player_guilds(max_workers=10, delay=0.2, min_level=0):
-    """Check guilds for all online players"""
-    # Load cached player data from database
-    cache = db.get_all_players_from_cache()
+def check_player_guilds(max_workers=10, min_level=0, players=None):
+    """Check guilds for all online players.
 
-    # Periodically clear expired cache entries
-    db.clear_expired_cache()
-
-    players = get_online_players()
+    Callers that already fetched the online player list can pass it as `players`
+    to avoid a second request to the Wynncraft API.
+    """
+    if players is None:
+        players = get_online_players()
     # Exclude blacklisted players from consideration
     players = [p for p in players if not db.is_blacklisted(p)]
 
+    # Load cached data for just the online players in one query
+    cache = db.get_players_bulk(players)
+
+    # Periodically clear expired cache entries
+    db.clear_expired_cache()
+
     print(f"Found {len(players)} online players")
 
     # Identify players that need to be fetched (not in cache or cache expired)
-    need_fetch = [p for p in players if p not in cache or not db.is_cache_valid(cache[p].get("timestamp"))]
-    cached_players = [p for p in players if p in cache and db.is_cache_valid(cache[p].get("timestamp"))]
+    valid = set(db.filter_valid(
+        ((p, cache[p].get("timestamp")) for p in players if p in cache),
+        hours=CACHE_EXPIRATION_HOURS
+    ))
+    need_fetch = [p for p in players if p not in valid]
+    cached_players = [p for p in players if p in valid]
 
     print(f"Need to fetch {len(need_fetch)} players, using {len(cached_players)} from cache")
 
@@ -206,22 +243,29 @@ def check_player_guilds(max_workers=10, delay=0.2, min_level=0):
             # Submit all tasks at once
             future_to_username = {executor.submit(get_player_data_from_api, username, cache): username for username in need_fetch}
 
-            # Process results as they complete
+            # Process results as they complete, keyed by the submitted username
             processed = 0
-            for future in future_to_username:
+            fetched = {}
+            for future in concurrent.futures.as_completed(future_to_username):
                 try:
                     username, guild, highest_level, activity = future.result()
                     processed += 1
 
-                    results[username] = {
+                    fetched[future_to_username[future]] = (username, {
                         "guild": guild,
                         "highest_level": highest_level,
                         "activity": activity
-                    }
+                    })
 
                     print(f"Progress: {processed}/{total_to_process} - {username}: Guild: {guild if guild else 'None'}, Level: {highest_level}, Activity: {activity}")
                 except Exception as e:
                     print(f"Error processing player: {e}")
+
+        # Add fetched players in request order so ties in the sorted outputs stay stable
+        for requested in need_fetch:
+            if requested in fetched:
+                username, data = fetched[requested]
+                results[username] = data
     return results
 
 def get_players_without_guild(results, min_level=0, min_activity=0):
@@ -299,8 +343,8 @@ def no_guild_players_api():
         all_online_players = get_online_players()
         total_online_players = len(all_online_players)
 
-        # Use fewer workers and longer delay to avoid rate limiting
-        results = check_player_guilds(max_workers=10, delay=0.2)
+        # Pacing is handled per request by the rate limit manager
+        results = check_player_guilds(max_workers=10, players=all_online_players)
 
         # Get players without a guild filtered by minimum level and activity
         no_guild_players = get_players_without_guild(results, min_level, min_activity)
@@ -327,24 +371,26 @@ def no_guild_players_api():
     except Exception as e:
         # Try to get players without a guild from the database
         try:
-            # Get all players from database
-            all_cached_players = db.get_all_players_from_cache()
-
-            # Filter for players without a guild and meeting min level, excluding blacklisted
-            cached_no_guild_players = []
-            for username, data in all_cached_players.items():
-                if db.is_blacklisted(username):
-                    continue
-                player_activity = data.get("activity", 0)
-                if data.get("guild") is None and data.get("highest_level", 0) >= min_level and player_activity >= min_activity:
-                    cached_no_guild_players.append({
+            # Filter cached players without a guild and meeting min level, excluding blacklisted,
+            # sorted by level in a single pass. The blacklist is read up front: the stream holds a
+            # pooled connection, so no other db call may run until it is exhausted
+            blacklist = db.get_blacklisted_identifiers()
+            cached_no_guild_players = sorted(
+                (
+                    {
                         "username": username,
                         "level": data.get("highest_level", 0),
-                        "activity": player_activity
-                    })
-
-            # Sort by level
-            cached_no_guild_players.sort(key=lambda x: x["level"], reverse=True)
+                        "activity": data.get("activity", 0)
+                    }
+                    for username, data in db.iter_all_players_from_cache()
+                    if data.get("guild") is None
+                    and data.get("highest_level", 0) >= min_level
+                    and data.get("activity", 0) >= min_activity
+                    and not db.is_blacklisted_in(blacklist, username)
+                ),
+                key=itemgetter("level"),
+                reverse=True
+            )
 
             # Try to get the total number of online players
             try:
@@ -381,8 +427,8 @@ def no_guild_players_api():
 @app.route('/api/refresh-cache', methods=['POST'])
 def refresh_cache_api():
     """API endpoint to manually refresh the cache"""
-    # Use fewer workers and longer delay to avoid rate limiting
-    results = check_player_guilds(max_workers=10, delay=0.2)
+    # Pacing is handled per request by the rate limit manager
+    results = check_player_guilds(max_workers=10)
 
     return jsonify({
         "status": "success",
@@ -390,6 +436,10 @@ def refresh_cache_api():
         "timestamp": datetime.now().isoformat()
     })
 
+def _ndjson_line(obj):
+    """Serialize one NDJSON stream message compactly (no whitespace after separators)"""
+    return json.dumps(obj, separators=(',', ':')) + '\n'
+
 @app.route('/api/no-guild-players-stream', methods=['GET'])
 def no_guild_players_stream_api():
     """Streaming API endpoint to get players without a guild, filtered by minimum level and minimum activity"""
@@ -403,12 +453,12 @@ def no_guild_players_stream_api():
             db.clear_old_blacklist_entries()
 
             # Send initial response header
-            yield json.dumps({
+            yield _ndjson_line({
                 "type": "init",
                 "timestamp": datetime.now().isoformat(),
                 "min_level": min_level,
                 "status": "processing"
-            }) + '\n'
+            })
 
             # Get total number of online players first
             all_online_players = get_online_players()
@@ -416,49 +466,31 @@ def no_guild_players_stream_api():
             all_online_players = [p for p in all_online_players if not db.is_blacklisted(p)]
             total_online_players = len(all_online_players)
 
-            yield json.dumps({
+            yield _ndjson_line({
                 "type": "status",
                 "message": f"Found {total_online_players} online players"
-            }) + '\n'
+            })
 
-            # Load cached player data from database
-            cache = db.get_all_players_from_cache()
+            # Load cached data for just the online players in one query
+            cache = db.get_players_bulk(all_online_players)
 
             # Periodically clear expired cache entries
             db.clear_expired_cache()
 
-            # Parallelize the filtering of players using a thread pool
-            with ThreadPoolExecutor(max_workers=20) as filter_executor:
-                # Function to check if a player needs to be fetched or can use cache
-                def classify_player(username):
-                    if username not in cache or not db.is_cache_valid(cache[username].get("timestamp")):
-                        return ("fetch", username)
-                    else:
-                        return ("cache", username)
-
-                # Submit all player classifications to thread pool
-                classification_futures = [filter_executor.submit(classify_player, player) for player in all_online_players]
-
-                # Collect results
-                need_fetch = []
-                cached_players = []
+            # Split players into cached and to-be-fetched with a single validity cutoff
+            valid = set(db.filter_valid(
+                ((p, cache[p].get("timestamp")) for p in all_online_players if p in cache),
+                hours=CACHE_EXPIRATION_HOURS
+            ))
+            need_fetch = [p for p in all_online_players if p not in valid]
+            cached_players = [p for p in all_online_players if p in valid]
 
-                for future in concurrent.futures.as_completed(classification_futures):
-                    try:
-                        player_type, username = future.result()
-                        if player_type == "fetch":
-                            need_fetch.append(username)
-                        else:
-                            cached_players.append(username)
-                    except Exception as e:
-                        print(f"Error classifying player: {e}")
-
-            yield json.dumps({
+            yield _ndjson_line({
                 "type": "status",
                 "message": f"Need to fetch {len(need_fetch)} players, using {len(cached_players)} from cache",
                 "cached_count": len(cached_players),
                 "fetch_count": len(need_fetch)
-            }) + '\n'
+            })
 
             processed_count = 0
             no_guild_players = []
@@ -519,7 +551,7 @@ def no_guild_players_stream_api():
 
                         if result is not None:
                             no_guild_players.append(result)
-                            yield json.dumps({
+                            yield _ndjson_line({
                                 "type": "player",
                                 "player": result,
                                 "progress": {
@@ -527,18 +559,18 @@ def no_guild_players_stream_api():
                                     "total": total_online_players,
                                     "percent": round((processed_count / total_online_players) * 100, 1) if total_online_players > 0 else 0
                                 }
-                            }) + '\n'
+                            })
 
                         # Update progress occasionally
                         if completed_tasks % 10 == 0 or completed_tasks == total_tasks:
-                            yield json.dumps({
+                            yield _ndjson_line({
                                 "type": "progress",
                                 "progress": {
                                     "processed": processed_count,
                                     "total": total_online_players,
                                     "percent": round((processed_count / total_online_players) * 100, 1) if total_online_players > 0 else 0
                                 }
-                            }) + '\n'
+                            })
                     except Exception as e:
                         print(f"Error processing cached player: {e}")
 
@@ -562,7 +594,7 @@ def no_guild_players_stream_api():
                             }
                             no_guild_players.append(player_info)
 
-                            yield json.dumps({
+                            yield _ndjson_line({
                                 "type": "player",
                                 "player": player_info,
                                 "progress": {
@@ -570,18 +602,18 @@ def no_guild_players_stream_api():
                                     "total": total_online_players,
                                     "percent": round((processed_count / total_online_players) * 100, 1) if total_online_players > 0 else 0
                                 }
-                            }) + '\n'
+                            })
 
                         # Update progress occasionally
                         if completed_tasks % 5 == 0 or completed_tasks == total_tasks:
-                            yield json.dumps({
+                            yield _ndjson_line({
                                 "type": "progress",
                                 "progress": {
                                     "processed": processed_count,
                                     "total": total_online_players,
                                     "percent": round((processed_count / total_online_players) * 100, 1) if total_online_players > 0 else 0
                                 }
-                            }) + '\n'
+                            })
 
                     except Exception as e:
                         print(f"Error processing fetch player: {e}")
@@ -591,7 +623,7 @@ def no_guild_players_stream_api():
 
                 # Send final summary
                 cache_size = db.get_cache_size()
-                yield json.dumps({
+                yield _ndjson_line({
                     "type": "complete",
                     "total_players": len(no_guild_players),
                     "cache_size": cache_size,
@@ -601,7 +633,7 @@ def no_guild_players_stream_api():
                     "timestamp": datetime.now().isoformat(),
                     "min_level": min_level,
                     "min_activity": min_activity
-                }) + '\n'
+                })
 
             finally:
                 # Ensure both executors are shut down properly
@@ -610,11 +642,11 @@ def no_guild_players_stream_api():
 
         except Exception as e:
             # Send error message
-            yield json.dumps({
+            yield _ndjson_line({
                 "type": "error",
                 "error_message": str(e),
                 "timestamp": datetime.now().isoformat()
-            }) + '\n'
+            })
 
     return Response(generate(), mimetype='application/x-ndjson')
 
@@ -649,6 +681,7 @@ def get_loot_data():
 @app.route('/api/rate-limit-status', methods=['GET'])
 def rate_limit_status_api():
     """API endpoint to get current rate limit status"""
+    now = datetime.now().isoformat()
     try:
         status_summary = rate_limit_manager.get_status_summary()
         queue_status = rate_limit_manager.get_queue_status()
@@ -663,7 +696,7 @@ def rate_limit_status_api():
 
         return jsonify({
             "status": "success",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "rate_limits": status_summary,
             "queue_status": queue_status,
             "timeout_config": {
@@ -675,7 +708,7 @@ def rate_limit_status_api():
         return jsonify({
             "status": "error",
             "error_message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }), 500
 
 @app.route('/api/region-mythic-prices', methods=['GET'])
@@ -763,13 +796,14 @@ def region_mythic_prices_api():
 @app.route('/api/mythic-items', methods=['POST'])
 def save_mythic_item_api():
     """API endpoint to save a mythic item's price"""
+    now = datetime.now().isoformat()
     try:
         data = request.get_json()
         if not data or 'mythic_name' not in data or 'price' not in data:
             return jsonify({
                 "status": "error",
                 "error": "Missing required fields: mythic_name and price",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }), 400
 
         mythic_name = data['mythic_name']
@@ -779,7 +813,7 @@ def save_mythic_item_api():
             return jsonify({
                 "status": "error",
                 "error": "Price cannot be negative",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }), 400
 
         success = db.save_mythic_item(mythic_name, price)
@@ -787,20 +821,20 @@ def save_mythic_item_api():
             return jsonify({
                 "status": "error",
                 "error": "Failed to save mythic item",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }), 500
 
         return jsonify({
             "status": "success",
             "message": f"Successfully saved price for {mythic_name}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         })
 
     except Exception as e:
         return jsonify({
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }), 500
 
 @app.route('/api/guild-ranking', methods=['GET'])
@@ -818,8 +852,8 @@ def guild_ranking_api():
         all_online_players = get_online_players()
         total_online_players = len(all_online_players)
 
-        # Use fewer workers and longer delay to avoid rate limiting
-        results = check_player_guilds(max_workers=10, delay=0.2)
+        # Pacing is handled per request by the rate limit manager
+        results = check_player_guilds(max_workers=10, players=all_online_players)
 
         # Default ranking from player endpoint/cache as baseline
         baseline_guild_ranking = get_guild_ranking(results, min_level)
@@ -881,13 +915,12 @@ def guild_ranking_api():
     except Exception as e:
         # Try to get guild ranking from the database
         try:
-            # Get all players from database
-            all_cached_players = db.get_all_players_from_cache()
-
-            # Filter for players with guilds and meeting min level, excluding blacklisted
+            # Stream all cached players, keeping those with guilds that meet min level, excluding blacklisted
+            # (blacklist read before streaming, since the stream holds a pooled connection)
+            blacklist = db.get_blacklisted_identifiers()
             cached_guild_members = {}
-            for username, data in all_cached_players.items():
-                if db.is_blacklisted(username):
+            for username, data in db.iter_all_players_from_cache():
+                if db.is_blacklisted_in(blacklist, username):
                     continue
                 guild = data.get("guild")
                 level = data.get("highest_level", 0)
@@ -951,6 +984,7 @@ def guild_ranking_api():
 @app.route('/api/blacklist/add', methods=['GET'])
 def add_to_blacklist_api():
     """Add a player to the blacklist via query params: player (required), reason (optional)."""
+    now = datetime.now().isoformat()
     try:
         player = request.args.get('player', type=str)
         reason = request.args.get('reason', default=None, type=str)
@@ -959,7 +993,7 @@ def add_to_blacklist_api():
             return jsonify({
                 "status": "error",
                 "error": "Missing required query parameter: player",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }), 400
 
         success = db.add_to_blacklist(player, reason)
@@ -967,7 +1001,7 @@ def add_to_blacklist_api():
             return jsonify({
                 "status": "error",
                 "error": "Failed to add player to blacklist",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }), 500
 
         return jsonify({
@@ -975,13 +1009,13 @@ def add_to_blacklist_api():
             "message": f"Player '{player}' has been added to the blacklist",
             "player": player,
             "reason": reason,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         })
     except Exception as e:
         return jsonify({
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }), 500
 
 if __name__ == "__main__":
@@ -3,7 +3,8 @@ Configuration settings for the rate limiting system.
 """
 
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 
 class RateLimitConfig:
@@ -15,6 +16,9 @@ class RateLimitConfig:
     MAX_QUEUE_SIZE = int(os.getenv('RATE_LIMIT_MAX_QUEUE_SIZE', '1000'))
     QUEUE_WORKERS = int(os.getenv('RATE_LIMIT_QUEUE_WORKERS', '5'))
     MAX_RETRIES = int(os.getenv('RATE_LIMIT_MAX_RETRIES', '3'))
+    REQUESTS_PER_MINUTE = int(os.getenv('RATE_LIMIT_REQUESTS_PER_MINUTE', '0'))  # client-side cap, 0 = disabled
+    RESPONSE_CACHE_SIZE = int(os.getenv('RATE_LIMIT_RESPONSE_CACHE_SIZE', '0'))  # cached GET responses, 0 = disabled
+    CONNECTION_POOL_SIZE = int(os.getenv('RATE_LIMIT_CONNECTION_POOL_SIZE', '32'))  # keep-alive connections per host
 
     # Timeout settings (in seconds)
     REQUEST_TIMEOUT = float(os.getenv('RATE_LIMIT_REQUEST_TIMEOUT', '270'))  # 4.5 minutes
@@ -29,6 +33,10 @@ class RateLimitConfig:
     TOKEN_ROTATION_ENABLED = os.getenv('TOKEN_ROTATION_ENABLED', 'true').lower() == 'true'
     TOKEN_ROTATION_COOLDOWN = int(os.getenv('TOKEN_ROTATION_COOLDOWN', '60'))  # seconds to wait before retrying exhausted token
     
+    # Cached results of to_dict() and the per-endpoint settings, stored per class
+    _dict_cache: Optional[Dict[str, Any]] = None
+    _api_settings_cache: Optional[Mapping[str, Mapping[str, Any]]] = None
+
     # API-specific settings
     WYNNCRAFT_API_SETTINGS = {
         'default_delay': float(os.getenv('WYNNCRAFT_DEFAULT_DELAY', '0.2')),
@@ -36,6 +44,7 @@ class RateLimitConfig:
         'max_retries': int(os.getenv('WYNNCRAFT_MAX_RETRIES', '3')),
         'request_timeout': float(os.getenv('WYNNCRAFT_REQUEST_TIMEOUT', '270')),  # 4.5 minutes
         'connect_timeout': float(os.getenv('WYNNCRAFT_CONNECT_TIMEOUT', '10')),
+        'requests_per_minute': int(os.getenv('WYNNCRAFT_REQUESTS_PER_MINUTE', '0')),
     }
 
     NORI_FISH_API_SETTINGS = {
@@ -44,34 +53,55 @@ class RateLimitConfig:
         'max_retries': int(os.getenv('NORI_FISH_MAX_RETRIES', '2')),
         'request_timeout': float(os.getenv('NORI_FISH_REQUEST_TIMEOUT', '30')),   # 30 seconds
         'connect_timeout': float(os.getenv('NORI_FISH_CONNECT_TIMEOUT', '10')),
+        'requests_per_minute': int(os.getenv('NORI_FISH_REQUESTS_PER_MINUTE', '0')),
     }
     
     @classmethod
-    def get_api_settings(cls, api_name: str) -> Dict[str, Any]:
-        """Get settings for a specific API"""
-        api_settings = {
-            'wynncraft_player_api': cls.WYNNCRAFT_API_SETTINGS,
-            'wynncraft_api_v3': cls.WYNNCRAFT_API_SETTINGS,
-            'nori_fish_api': cls.NORI_FISH_API_SETTINGS,
-        }
-        
-        return api_settings.get(api_name, {
-            'default_delay': cls.DEFAULT_DELAY,
-            'throttle_threshold': cls.THROTTLE_THRESHOLD,
-            'max_retries': cls.MAX_RETRIES,
-            'request_timeout': cls.REQUEST_TIMEOUT,
-            'connect_timeout': cls.CONNECT_TIMEOUT,
+    def get_api_settings(cls, api_name: str) -> Mapping[str, Any]:
+        """Get settings for a specific API (read-only)"""
+        # Looked up in the class's own __dict__ so a subclass never reuses its parent's cache
+        settings = cls.__dict__.get('_api_settings_cache')
+        if settings is None:
+            settings = cls._build_api_settings()
+            cls._api_settings_cache = settings
+        return settings.get(api_name, settings['_default'])
+
+    @classmethod
+    def _build_api_settings(cls) -> Mapping[str, Mapping[str, Any]]:
+        """Per-endpoint settings from this class's attributes, built once so lookups are a single get"""
+        wynncraft = MappingProxyType(dict(cls.WYNNCRAFT_API_SETTINGS))
+        return MappingProxyType({
+            'wynncraft_player_api': wynncraft,
+            'wynncraft_api_v3': wynncraft,
+            'nori_fish_api': MappingProxyType(dict(cls.NORI_FISH_API_SETTINGS)),
+            '_default': MappingProxyType({
+                'default_delay': cls.DEFAULT_DELAY,
+                'throttle_threshold': cls.THROTTLE_THRESHOLD,
+                'max_retries': cls.MAX_RETRIES,
+                'request_timeout': cls.REQUEST_TIMEOUT,
+                'connect_timeout': cls.CONNECT_TIMEOUT,
+                'requests_per_minute': cls.REQUESTS_PER_MINUTE,
+            }),
         })
-    
+
     @classmethod
     def to_dict(cls) -> Dict[str, Any]:
-        """Convert configuration to dictionary"""
+        """Convert configuration to dictionary (built once, since settings are read at import)"""
+        if cls.__dict__.get('_dict_cache') is None:
+            cls._dict_cache = cls._build_dict()
+        return cls._dict_cache
+
+    @classmethod
+    def _build_dict(cls) -> Dict[str, Any]:
         return {
             'default_delay': cls.DEFAULT_DELAY,
             'throttle_threshold': cls.THROTTLE_THRESHOLD,
             'max_queue_size': cls.MAX_QUEUE_SIZE,
             'queue_workers': cls.QUEUE_WORKERS,
             'max_retries': cls.MAX_RETRIES,
+            'requests_per_minute': cls.REQUESTS_PER_MINUTE,
+            'response_cache_size': cls.RESPONSE_CACHE_SIZE,
+            'connection_pool_size': cls.CONNECTION_POOL_SIZE,
             'request_timeout': cls.REQUEST_TIMEOUT,
             'connect_timeout': cls.CONNECT_TIMEOUT,
             'log_level': cls.LOG_LEVEL,
@@ -1,42 +1,145 @@
+import sys
 import time
 import threading
 import queue
+import heapq
+import itertools
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, Optional, Tuple, Any, Callable
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 import requests
-import re
-from concurrent.futures import ThreadPoolExecutor, Future
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future
 from rate_limit_config import RateLimitConfig
 
-
-@dataclass
+# Use fastrlock's cheaper reentrant lock when it's installed
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:
+    _RLock = threading.RLock
+
+
+def _wall_clock_base() -> datetime:
+    """Wall-clock time corresponding to time.monotonic() == 0; read once per status call"""
+    return datetime.now() - timedelta(seconds=time.monotonic())
+
+
+def _monotonic_to_datetime(monotonic_time: Optional[float], base: Optional[datetime] = None) -> Optional[datetime]:
+    """Convert a time.monotonic() timestamp to wall-clock time (for status output only)"""
+    if monotonic_time is None:
+        return None
+    if base is None:
+        base = _wall_clock_base()
+    return base + timedelta(seconds=monotonic_time)
+
+
+def _monotonic_to_iso(monotonic_time: Optional[float], base: datetime) -> Optional[str]:
+    """ISO-format a time.monotonic() timestamp against a precomputed wall-clock base"""
+    if monotonic_time is None:
+        return None
+    return (base + timedelta(seconds=monotonic_time)).isoformat()
+
+
+_logger = logging.getLogger(__name__)
+
+# Setup logging once per process if the application hasn't configured a handler
+if not _logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _logger.addHandler(_handler)
+    _logger.setLevel(logging.INFO)
+
+# dataclass(slots=True) needs Python 3.10+; the Vercel runtime is pinned to 3.9
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _parse_max_age(cache_control: str) -> Optional[int]:
+    """Extract the max-age directive from a Cache-Control value without the regex engine"""
+    _, found, tail = cache_control.partition('max-age=')
+    if not found:
+        return None
+    end = 0
+    while end < len(tail) and tail[end].isdigit():
+        end += 1
+    return int(tail[:end]) if end else None
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    """Parse an RFC 7231 HTTP date into naive local time (comparable with datetime.now())"""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        # '-0000' means UTC with no offset information
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone().replace(tzinfo=None)
+
+
+def _parse_retry_after(value: Optional[str], default: float = 5) -> float:
+    """Parse a Retry-After header, which is either delay-seconds or an HTTP date"""
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        retry_at = _parse_http_date(value)
+        if retry_at is None:
+            return default
+        return max(0.0, (retry_at - datetime.now()).total_seconds())
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RateLimitInfo:
     """Data class to store rate limit information for a specific API endpoint"""
     limit: Optional[int] = None  # Maximum requests per cycle (RateLimit-Limit)
     remaining: Optional[int] = None  # Remaining requests (RateLimit-Remaining)
-    reset_time: Optional[datetime] = None  # When rate limit resets (RateLimit-Reset)
+    reset_monotonic: Optional[float] = None  # time.monotonic() when rate limit resets (RateLimit-Reset)
     cache_control_ttl: Optional[int] = None  # TTL from Cache-Control header
     expires: Optional[datetime] = None  # Expiration time from Expires header
-    last_request_time: Optional[datetime] = None  # When last request was made
+    last_request_monotonic: Optional[float] = None  # time.monotonic() when last request was made
     api_version: Optional[str] = None  # API version from Version header
     token: Optional[str] = None  # API token used for this rate limit info
-    
-    def is_rate_limited(self) -> bool:
-        """Check if we're currently rate limited"""
-        if self.remaining is not None and self.remaining <= 0:
-            if self.reset_time and datetime.now() < self.reset_time:
+    # Serialized time-independent status fields, filled on first status call (copies start empty)
+    _summary: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def reset_time(self) -> Optional[datetime]:
+        """Wall-clock time when the rate limit resets"""
+        return _monotonic_to_datetime(self.reset_monotonic)
+
+    @property
+    def last_request_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last request"""
+        return _monotonic_to_datetime(self.last_request_monotonic)
+
+    def is_rate_limited(self, now: Optional[float] = None) -> bool:
+        """Check if we're currently rate limited (now: time.monotonic() if already read)"""
+        if self.remaining is not None and self.remaining <= 0 and self.reset_monotonic is not None:
+            if (now if now is not None else time.monotonic()) < self.reset_monotonic:
                 return True
         return False
     
-    def seconds_until_reset(self) -> int:
-        """Get seconds until rate limit resets"""
-        if self.reset_time:
-            delta = self.reset_time - datetime.now()
-            return max(0, int(delta.total_seconds()))
+    def seconds_until_reset(self, now: Optional[float] = None) -> int:
+        """Get seconds until rate limit resets (now: time.monotonic() if already read)"""
+        if self.reset_monotonic is not None:
+            return max(0, int(self.reset_monotonic - (now if now is not None else time.monotonic())))
         return 0
     
+    def merge(self, newer: 'RateLimitInfo') -> 'RateLimitInfo':
+        """Return a copy updated with the fields present in a newer response"""
+        changes = {}
+        for name in _MERGE_FIELDS:
+            value = getattr(newer, name)
+            if value is not None:
+                changes[name] = value
+        return replace(self, last_request_monotonic=newer.last_request_monotonic, **changes)
+
     def should_throttle(self, threshold: int = 10) -> bool:
         """Check if we should throttle requests based on remaining quota"""
         if self.remaining is not None and self.remaining <= threshold:
@@ -44,9 +147,135 @@ class RateLimitInfo:
         return False
 
 
+@lru_cache(maxsize=64)
+def _mask_token(token: str) -> str:
+    """Mask a token for display (show only first 8 and last 4 characters)"""
+    return f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "***"
+
+
+# Endpoint groups by host (exact or subdomain) and path prefix; first match wins, so specific
+# prefixes go first
+_PREFIX_TABLE = (
+    ('api.wynncraft.com', '/v3/player/', 'wynncraft_player_api'),
+    ('api.wynncraft.com', '/v3/', 'wynncraft_api_v3'),
+    ('nori.fish', '', 'nori_fish_api'),
+)
+_KNOWN_HOSTS = tuple(dict.fromkeys(host for host, _, _ in _PREFIX_TABLE))
+
+# Endpoint keys that authenticate with (and rotate) Wynncraft API tokens
+_WYNNCRAFT_ENDPOINTS = frozenset({'wynncraft_player_api', 'wynncraft_api_v3'})
+
+# Response header names read on every response
+_LIMIT_HEADER = 'RateLimit-Limit'
+_REMAINING_HEADER = 'RateLimit-Remaining'
+_RESET_HEADER = 'RateLimit-Reset'
+_CACHE_CONTROL_HEADER = 'Cache-Control'
+_EXPIRES_HEADER = 'Expires'
+_VERSION_HEADER = 'Version'
+_RETRY_AFTER_HEADER = 'Retry-After'
+_SET_COOKIE_HEADER = 'Set-Cookie'
+
+# Queued requests that would wait longer than this (seconds) go back on the delayed heap
+# instead of sleeping on a worker thread
+_REQUEUE_THRESHOLD = 0.1
+
+# Hosts that get a dedicated connection pool on the shared session
+_DEDICATED_POOL_PREFIXES = ('https://api.wynncraft.com', 'https://nori.fish')
+
+# Response cache TTLs (seconds) for endpoints whose responses carry no Cache-Control header
+_FALLBACK_CACHE_TTL = {
+    'wynncraft_player_api': 30,
+    'wynncraft_api_v3': 60,
+    'nori_fish_api': 10,
+}
+
+# Request options that make a GET response specific to the caller, so it is never cached
+_UNCACHEABLE_KWARGS = frozenset({'headers', 'cookies', 'auth', 'data', 'json', 'files', 'stream'})
+
+# RateLimitInfo fields that a newer response only overrides when it actually carries them
+_MERGE_FIELDS = ('limit', 'remaining', 'reset_monotonic', 'cache_control_ttl', 'expires', 'api_version', 'token')
+
+
+class TokenBucket:
+    """Continuous-rate token bucket pacing requests to `rate_per_min`.
+
+    Waiters block on a Condition for exactly the time until enough tokens have
+    refilled, so concurrent workers are released one by one instead of all sleeping
+    the same delay and then bursting together.
+    """
+
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate_per_min: Tokens added per minute
+            capacity: Maximum tokens held (burst size), defaults to rate_per_min
+        """
+        self.rate_per_min = rate_per_min
+        self.capacity = capacity if capacity is not None else rate_per_min
+        self._tokens = self.capacity
+        self._last_update = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (lock held)"""
+        elapsed = now - self._last_update
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_min / 60.0)
+        self._last_update = now
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` could be taken, without taking them"""
+        with self._cond:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                return 0.0
+            return (tokens - self._tokens) * 60.0 / self.rate_per_min
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    # Let the next waiter recompute its wait against the new balance
+                    self._cond.notify()
+                    return now - start
+                wait_time = (tokens - self._tokens) * 60.0 / self.rate_per_min
+                self._cond.wait(timeout=wait_time)
+
+
+# TokenManagers shared by every RateLimitManager configured with the same tokens and cooldown
+_TOKEN_MANAGERS: Dict[Tuple[Tuple[str, ...], int], 'TokenManager'] = {}
+_TOKEN_MANAGERS_LOCK = threading.Lock()
+
+
 class TokenManager:
     """Manages API token rotation and rate limiting per token"""
 
+    @classmethod
+    def get_or_create(cls, tokens: list, cooldown_seconds: int = 60) -> 'TokenManager':
+        """
+        Get the shared token manager for a set of tokens, creating it on first use.
+
+        The tokens draw on the same upstream quota whichever manager sends the request,
+        so their exhaustion state is tracked once per process.
+        """
+        key = (tuple(dict.fromkeys(tokens)), cooldown_seconds)
+        with _TOKEN_MANAGERS_LOCK:
+            token_manager = _TOKEN_MANAGERS.get(key)
+            if token_manager is None:
+                token_manager = _TOKEN_MANAGERS[key] = cls(key[0], cooldown_seconds)
+            return token_manager
+
     def __init__(self, tokens: list, cooldown_seconds: int = 60):
         """
         Initialize token manager.
@@ -55,23 +284,38 @@ class TokenManager:
             tokens: List of API tokens
             cooldown_seconds: Seconds to wait before retrying exhausted token
         """
-        self.tokens = tokens
+        # Fixed for the manager's lifetime; duplicates are dropped since state is tracked per token string
+        self.tokens = tuple(dict.fromkeys(tokens))
         self.cooldown_seconds = cooldown_seconds
         self.current_token_index = 0
         self.token_rate_limits: Dict[str, RateLimitInfo] = {}
-        self._lock = threading.RLock()
+        # time.monotonic() before which each exhausted token is unavailable (absent = available)
+        self._token_next_eligible: Dict[str, float] = {}
+        self._lock = _RLock()
 
         # Initialize rate limit info for each token
-        for token in tokens:
+        for token in self.tokens:
             self.token_rate_limits[token] = RateLimitInfo(token=token)
 
+        # Masked forms for status output, computed once
+        self._masked = {token: _mask_token(token) for token in self.tokens}
+        # Status fields fixed by the token list, merged into every get_token_status result
+        self._base_status = {
+            'total_tokens': len(self.tokens),
+            'rotation_enabled': len(self.tokens) > 1
+        }
+
+        # Shared per-token header dicts; callers must copy before modifying
+        self.auth_headers: Dict[str, Dict[str, str]] = {
+            token: {'Authorization': f'Bearer {token}'} for token in self.tokens
+        }
+
     def get_current_token(self) -> Optional[str]:
         """Get the currently active token"""
-        if not self.tokens:
-            return None
-
-        with self._lock:
-            return self.tokens[self.current_token_index] if self.current_token_index < len(self.tokens) else None
+        # Lock-free: read the index and list once each so a concurrent rotation can't cause an IndexError
+        tokens = self.tokens
+        index = self.current_token_index
+        return tokens[index] if index < len(tokens) else None
 
     def get_available_token(self) -> Optional[str]:
         """
@@ -83,37 +327,29 @@ class TokenManager:
 
         with self._lock:
             # Check if current token is available
+            now = time.monotonic()
             current_token = self.get_current_token()
-            if current_token and self._is_token_available(current_token):
+            if current_token and self._is_token_available(current_token, now):
                 return current_token
 
             # Try to find an available token
             for i in range(len(self.tokens)):
                 token = self.tokens[i]
-                if self._is_token_available(token):
+                if self._is_token_available(token, now):
                     self.current_token_index = i
                     return token
 
             # No tokens available, return current token anyway (will handle rate limiting)
             return current_token
 
-    def _is_token_available(self, token: str) -> bool:
+    def _is_token_available(self, token: str, now: Optional[float] = None) -> bool:
         """Check if a token is available (not rate limited)"""
-        if token not in self.token_rate_limits:
-            return True
-
-        rate_limit_info = self.token_rate_limits[token]
-
-        # If we don't have rate limit info yet, assume it's available
-        if rate_limit_info.remaining is None:
-            return True
-
-        # Check if token is rate limited
-        if rate_limit_info.is_rate_limited():
-            return False
-
+        # Tokens without info, or not exhausted, have no entry and are available.
         # Do not throttle based on remaining; treat as available until actually rate limited
-        return True
+        next_eligible = self._token_next_eligible.get(token)
+        if next_eligible is None:
+            return True
+        return (now if now is not None else time.monotonic()) >= next_eligible
 
     def update_token_rate_limit(self, token: str, rate_limit_info: RateLimitInfo) -> None:
         """Update rate limit information for a specific token"""
@@ -121,10 +357,18 @@ class TokenManager:
             return
 
         with self._lock:
-            # Update the token's rate limit info
-            rate_limit_info.token = token
+            # Update the token's rate limit info (stored infos are treated as immutable)
+            if rate_limit_info.token != token:
+                rate_limit_info = replace(rate_limit_info, token=token)
             self.token_rate_limits[token] = rate_limit_info
 
+            # Precompute when the token becomes usable again, so availability checks are one compare
+            if (rate_limit_info.remaining is not None and rate_limit_info.remaining <= 0
+                    and rate_limit_info.reset_monotonic is not None):
+                self._token_next_eligible[token] = rate_limit_info.reset_monotonic
+            else:
+                self._token_next_eligible.pop(token, None)
+
             # If current token is exhausted, try to rotate
             if token == self.get_current_token() and not self._is_token_available(token):
                 self._rotate_to_next_available_token()
@@ -134,14 +378,14 @@ class TokenManager:
         if len(self.tokens) <= 1:
             return
 
-        original_index = self.current_token_index
+        now = time.monotonic()
 
         # Try each token in sequence
         for i in range(1, len(self.tokens)):
             next_index = (self.current_token_index + i) % len(self.tokens)
             next_token = self.tokens[next_index]
 
-            if self._is_token_available(next_token):
+            if self._is_token_available(next_token, now):
                 self.current_token_index = next_index
                 return
 
@@ -152,52 +396,52 @@ class TokenManager:
         """Get status of all tokens"""
         with self._lock:
             status = {}
+            current_token = self.get_current_token()
+            now = time.monotonic()
+            base = _wall_clock_base()
             for token in self.tokens:
-                # Mask token for security (show only first 8 and last 4 characters)
-                masked_token = f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "***"
-
                 rate_limit_info = self.token_rate_limits.get(token, RateLimitInfo())
-                status[masked_token] = {
-                    'is_current': token == self.get_current_token(),
-                    'is_available': self._is_token_available(token),
+                status[self._masked[token]] = {
+                    'is_current': token == current_token,
+                    'is_available': self._is_token_available(token, now),
                     'limit': rate_limit_info.limit,
                     'remaining': rate_limit_info.remaining,
-                    'reset_time': rate_limit_info.reset_time.isoformat() if rate_limit_info.reset_time else None,
-                    'seconds_until_reset': rate_limit_info.seconds_until_reset(),
-                    'is_rate_limited': rate_limit_info.is_rate_limited(),
-                    'last_request_time': rate_limit_info.last_request_time.isoformat() if rate_limit_info.last_request_time else None
+                    'reset_time': _monotonic_to_iso(rate_limit_info.reset_monotonic, base),
+                    'seconds_until_reset': rate_limit_info.seconds_until_reset(now),
+                    'is_rate_limited': rate_limit_info.is_rate_limited(now),
+                    'last_request_time': _monotonic_to_iso(rate_limit_info.last_request_monotonic, base)
                 }
 
             return {
                 'tokens': status,
                 'current_token_index': self.current_token_index,
-                'total_tokens': len(self.tokens),
-                'rotation_enabled': len(self.tokens) > 1
+                **self._base_status
             }
 
     def has_available_token(self) -> bool:
         """Return True if any configured token is currently available (not rate limited)."""
         if not self.tokens:
             return False
+        # Fast path: some token has never been exhausted
+        if len(self._token_next_eligible) < len(self.tokens):
+            return True
         with self._lock:
+            now = time.monotonic()
             for token in self.tokens:
-                if self._is_token_available(token):
+                if self._is_token_available(token, now):
                     return True
             return False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class QueuedRequest:
     """Data class for queued requests"""
     url: str
     kwargs: Dict[str, Any]
     future: Future
     priority: int = 0  # Lower numbers = higher priority
-    queued_at: datetime = None
-
-    def __post_init__(self):
-        if self.queued_at is None:
-            self.queued_at = datetime.now()
+    queued_at: float = field(default_factory=time.monotonic)  # time.monotonic() when queued
+    not_before: float = 0.0  # time.monotonic() before which the request must not be sent
 
 
 class RateLimitManager:
@@ -230,55 +474,80 @@ class RateLimitManager:
         self.max_queue_size = max_queue_size if max_queue_size is not None else config.MAX_QUEUE_SIZE
         self.request_timeout = config.REQUEST_TIMEOUT
         self.connect_timeout = config.CONNECT_TIMEOUT
+        self.response_cache_size = config.RESPONSE_CACHE_SIZE
+        self.connection_pool_size = config.CONNECTION_POOL_SIZE
         queue_workers = queue_workers if queue_workers is not None else config.QUEUE_WORKERS
 
+        # (connect, request) timeouts per known endpoint, resolved once; other hosts use the defaults
+        self._timeouts: Dict[str, Tuple[float, float]] = {
+            endpoint_key: self._resolve_timeouts(endpoint_key) for _, _, endpoint_key in _PREFIX_TABLE
+        }
+        self._default_timeouts = self._resolve_timeouts('_default')
+
         # Initialize token manager for Wynncraft API
         wynncraft_tokens = config.get_wynncraft_tokens()
-        self.token_manager = TokenManager(wynncraft_tokens, config.TOKEN_ROTATION_COOLDOWN) if wynncraft_tokens else None
+        self.token_manager = (TokenManager.get_or_create(wynncraft_tokens, config.TOKEN_ROTATION_COOLDOWN)
+                              if wynncraft_tokens else None)
         self._rate_limits: Dict[str, RateLimitInfo] = {}
-        self._lock = threading.RLock()  # Thread-safe access to rate limit data
-        self._request_queue = queue.PriorityQueue(maxsize=max_queue_size)
-        self._queue_executor = ThreadPoolExecutor(max_workers=queue_workers, thread_name_prefix="RateLimit")
+        # Client-side pacing buckets per endpoint (None where no requests_per_minute cap is configured)
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        # Cached GET responses: cache key -> (time.monotonic() expiry, response), least recently used first
+        self._response_cache: 'OrderedDict[str, Tuple[float, requests.Response]]' = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._lock = _RLock()  # Thread-safe access to rate limit data
+        # Ready requests as a heap of (priority, request_id, QueuedRequest), and requests still
+        # waiting out a rate limit as a heap of (not_before, priority, request_id, QueuedRequest).
+        # Both are guarded by one condition.
+        self._heap = []
+        self._delayed = []
+        self._heap_cv = threading.Condition()
+        self._unfinished = 0  # queued or in-flight requests, for shutdown's join
+        self._seq = itertools.count()  # tiebreaker: FIFO order within the same priority
         self._queue_running = True
-        self._logger = logging.getLogger(__name__)
-
-        # Setup logging if not already configured
-        if not self._logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self._logger.addHandler(handler)
-            self._logger.setLevel(logging.INFO)
-
-        # Start queue processing workers
-        for i in range(queue_workers):
-            self._queue_executor.submit(self._process_queue)
+        self._logger = _logger
+
+        # Shared session so TCP/TLS connections are reused across requests; the known API hosts get
+        # their own adapters so one host's keep-alive pool never evicts another's. Direct callers
+        # (the app's executor fan-outs) use the pool too, so it is sized independently of the workers
+        self._session = requests.Session()
+        for prefix in _DEDICATED_POOL_PREFIXES + ('https://', 'http://'):
+            self._session.mount(prefix, HTTPAdapter(
+                pool_connections=queue_workers, pool_maxsize=self.connection_pool_size, max_retries=0
+            ))
+
+        # Start queue processing workers (long-lived loops, so plain daemon threads rather than an executor)
+        self._workers = [
+            threading.Thread(target=self._process_queue, name=f"RateLimit-{i}", daemon=True)
+            for i in range(queue_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
     
     def _get_endpoint_key(self, url: str) -> str:
         """
         Extract a consistent endpoint key from URL for rate limit tracking.
         Groups similar endpoints together (e.g., different player IDs use same limits).
         """
-        # Remove query parameters and normalize
-        base_url = url.split('?')[0]
-        
-        # Group player-specific endpoints
-        if 'api.wynncraft.com/v3/player/' in base_url:
-            return 'wynncraft_player_api'
-        elif 'api.wynncraft.com/v3/' in base_url:
-            return 'wynncraft_api_v3'
-        elif 'nori.fish' in base_url:
-            return 'nori_fish_api'
-        else:
-            # For other APIs, use the domain
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(base_url)
-                return f"{parsed.netloc}_api"
-            except:
-                return 'unknown_api'
+        # Remove query parameters before the cached lookup
+        return self._endpoint_key_cached(url.partition('?')[0])
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _endpoint_key_cached(base_url: str) -> str:
+        """Map a query-less URL to its endpoint key (cached per URL)"""
+        location = (base_url.partition('://')[2] or base_url).partition('#')[0]
+        netloc, slash, path = location.partition('/')
+        hostname = netloc.rpartition('@')[2].partition(':')[0].lower()
+        # One C-level endswith over all known hosts rejects other hosts before the ordered scan
+        if hostname.endswith(_KNOWN_HOSTS):
+            path = slash + path
+            for host, path_prefix, endpoint_key in _PREFIX_TABLE:
+                if ((hostname == host or hostname.endswith('.' + host))
+                        and path.startswith(path_prefix)):
+                    return endpoint_key
+
+        # For other APIs, use the domain (netloc) without a full URL parse
+        return f"{netloc}_api" if netloc else 'unknown_api'
 
     def _get_timeout_settings(self, url: str) -> Tuple[float, float]:
         """
@@ -290,7 +559,14 @@ class RateLimitManager:
         Returns:
             Tuple of (connect_timeout, request_timeout)
         """
-        endpoint_key = self._get_endpoint_key(url)
+        return self._get_timeout_settings_for_key(self._get_endpoint_key(url))
+
+    def _get_timeout_settings_for_key(self, endpoint_key: str) -> Tuple[float, float]:
+        """_get_timeout_settings for an already-resolved endpoint key"""
+        return self._timeouts.get(endpoint_key, self._default_timeouts)
+
+    def _resolve_timeouts(self, endpoint_key: str) -> Tuple[float, float]:
+        """Read (connect_timeout, request_timeout) for an endpoint key from the config"""
         api_settings = self.config.get_api_settings(endpoint_key)
 
         connect_timeout = api_settings.get('connect_timeout', self.connect_timeout)
@@ -308,17 +584,19 @@ class RateLimitManager:
         Returns:
             Dictionary of headers to include in the request
         """
-        headers = {}
-        endpoint_key = self._get_endpoint_key(url)
+        return self._get_auth_headers_for_key(self._get_endpoint_key(url))
 
+    def _get_auth_headers_for_key(self, endpoint_key: str) -> Dict[str, str]:
+        """_get_auth_headers for an already-resolved endpoint key"""
         # Only add auth headers for Wynncraft API endpoints
-        if endpoint_key in ['wynncraft_player_api', 'wynncraft_api_v3'] and self.token_manager:
+        if endpoint_key in _WYNNCRAFT_ENDPOINTS and self.token_manager:
             token = self.token_manager.get_available_token()
             if token:
-                headers['Authorization'] = f'Bearer {token}'
-                self._logger.debug(f"Using token {token[:8]}... for {endpoint_key}")
+                self._logger.debug("Using token %.8s... for %s", token, endpoint_key)
+                # Copy the precomputed dict, since make_request merges into and rotates it
+                return dict(self.token_manager.auth_headers[token])
 
-        return headers
+        return {}
     
     def parse_headers(self, response: requests.Response) -> RateLimitInfo:
         """
@@ -330,70 +608,73 @@ class RateLimitManager:
         Returns:
             RateLimitInfo object with parsed header data
         """
-        headers = response.headers
-        rate_limit_info = RateLimitInfo()
+        # Bind the lookup once; every header below is read through it
+        get_header = response.headers.get
+        now = time.monotonic()
+        rate_limit_info = RateLimitInfo(last_request_monotonic=now)
         
         try:
-            # Parse RateLimit headers
-            if 'RateLimit-Limit' in headers:
-                rate_limit_info.limit = int(headers['RateLimit-Limit'])
-            
-            if 'RateLimit-Remaining' in headers:
-                rate_limit_info.remaining = int(headers['RateLimit-Remaining'])
-            
-            if 'RateLimit-Reset' in headers:
+            # Parse RateLimit headers (one case-insensitive lookup per header)
+            limit = get_header(_LIMIT_HEADER)
+            if limit is not None:
+                rate_limit_info.limit = int(limit)
+
+            remaining = get_header(_REMAINING_HEADER)
+            if remaining is not None:
+                rate_limit_info.remaining = int(remaining)
+
+            reset = get_header(_RESET_HEADER)
+            if reset is not None:
                 # RateLimit-Reset is typically seconds until reset
-                reset_seconds = int(headers['RateLimit-Reset'])
-                rate_limit_info.reset_time = datetime.now() + timedelta(seconds=reset_seconds)
-            
+                rate_limit_info.reset_monotonic = now + int(reset)
+
             # Parse Cache-Control header for TTL
-            if 'Cache-Control' in headers:
-                cache_control = headers['Cache-Control']
+            cache_control = get_header(_CACHE_CONTROL_HEADER)
+            if cache_control is not None:
                 # Look for max-age directive
-                max_age_match = re.search(r'max-age=(\d+)', cache_control)
-                if max_age_match:
-                    rate_limit_info.cache_control_ttl = int(max_age_match.group(1))
-            
+                max_age = _parse_max_age(cache_control)
+                if max_age is not None:
+                    rate_limit_info.cache_control_ttl = max_age
+
             # Parse Expires header
-            if 'Expires' in headers:
-                try:
-                    # Parse HTTP date format
-                    expires_str = headers['Expires']
-                    rate_limit_info.expires = datetime.strptime(
-                        expires_str, '%a, %d %b %Y %H:%M:%S %Z'
-                    )
-                except ValueError:
-                    # Try alternative formats
-                    try:
-                        rate_limit_info.expires = datetime.strptime(
-                            expires_str, '%a, %d %b %Y %H:%M:%S GMT'
-                        )
-                    except ValueError:
-                        self._logger.warning(f"Could not parse Expires header: {expires_str}")
-            
+            expires_str = get_header(_EXPIRES_HEADER)
+            if expires_str is not None:
+                expires = _parse_http_date(expires_str)
+                if expires is not None:
+                    rate_limit_info.expires = expires
+                else:
+                    self._logger.warning("Could not parse Expires header: %s", expires_str)
+
             # Parse API version
-            if 'Version' in headers:
-                rate_limit_info.api_version = headers['Version']
-            
-            # Set last request time
-            rate_limit_info.last_request_time = datetime.now()
-            
+            api_version = get_header(_VERSION_HEADER)
+            if api_version is not None:
+                rate_limit_info.api_version = api_version
+
         except (ValueError, TypeError) as e:
-            self._logger.warning(f"Error parsing rate limit headers: {e}")
+            self._logger.warning("Error parsing rate limit headers: %s", e)
         
         return rate_limit_info
 
     def _process_queue(self) -> None:
         """Worker method to process queued requests"""
-        while self._queue_running:
+        while True:
             try:
-                # Get next request from queue (blocks until available)
-                priority, request_id, queued_request = self._request_queue.get(timeout=1.0)
-
-                if not self._queue_running:
-                    break
+                # Get next ready request (blocks until available, drains both heaps on shutdown)
+                with self._heap_cv:
+                    queued_request = self._next_ready_request()
+                    if queued_request is None:
+                        break
 
+                requeued = False
                 try:
+                    # Still rate limited (e.g. the limit was hit after it was queued): hand it back to
+                    # the delayed heap and free this worker for other endpoints
+                    delay = self._queued_request_delay(queued_request)
+                    if delay > _REQUEUE_THRESHOLD:
+                        self._requeue_delayed(queued_request, delay)
+                        requeued = True
+                        continue
+
                     # Use the enhanced make_request method with retry logic
                     response = self.make_request(queued_request.url, **queued_request.kwargs)
 
@@ -403,14 +684,58 @@ class RateLimitManager:
                 except Exception as e:
                     # Set the exception on the future
                     queued_request.future.set_exception(e)
-                    self._logger.error(f"Error processing queued request: {e}")
+                    self._logger.error("Error processing queued request: %s", e)
                 finally:
-                    self._request_queue.task_done()
+                    # A requeued request is still outstanding; anything else is done
+                    if not requeued:
+                        with self._heap_cv:
+                            self._unfinished -= 1
+                            if not self._unfinished:
+                                self._heap_cv.notify_all()
 
-            except queue.Empty:
-                continue  # Timeout waiting for queue item, check if still running
             except Exception as e:
-                self._logger.error(f"Error in queue processing worker: {e}")
+                self._logger.error("Error in queue processing worker: %s", e)
+
+    def _queued_request_delay(self, queued_request: QueuedRequest) -> float:
+        """Seconds a queued request would have to wait before it can be sent"""
+        endpoint_key = self._get_endpoint_key(queued_request.url)
+        delay = self._calculate_delay_for_key(endpoint_key)
+        bucket = self._get_bucket(endpoint_key)
+        if bucket is not None:
+            delay = max(delay, bucket.time_until_available())
+        return delay
+
+    def _requeue_delayed(self, queued_request: QueuedRequest, delay: float) -> None:
+        """Put a request back on the delayed heap to become ready after `delay` seconds"""
+        with self._heap_cv:
+            queued_request.not_before = time.monotonic() + delay
+            heapq.heappush(self._delayed, (queued_request.not_before, queued_request.priority,
+                                           next(self._seq), queued_request))
+            self._heap_cv.notify()
+
+    def _next_ready_request(self) -> Optional[QueuedRequest]:
+        """Pop the highest-priority ready request, waiting for delayed ones to come due.
+
+        Must be called with self._heap_cv held. Returns None once the manager is
+        shutting down and nothing is left to process.
+        """
+        while True:
+            now = time.monotonic()
+            # Promote delayed requests whose wait is over
+            while self._delayed and self._delayed[0][0] <= now:
+                _, priority, request_id, queued_request = heapq.heappop(self._delayed)
+                heapq.heappush(self._heap, (priority, request_id, queued_request))
+
+            if self._heap:
+                return heapq.heappop(self._heap)[2]
+            if not self._delayed and not self._queue_running:
+                return None
+
+            # Sleep until the next delayed request is due (or a new one arrives)
+            timeout = 1.0
+            if self._delayed:
+                timeout = min(timeout, self._delayed[0][0] - now)
+            self._heap_cv.wait(timeout=timeout)
 
     def queue_request(self, url: str, priority: int = 0, **kwargs) -> Future:
         """
@@ -428,25 +753,38 @@ class RateLimitManager:
             queue.Full: If the request queue is full
         """
         future = Future()
-        request_id = id(future)  # Use future's id as unique identifier
+        request_id = next(self._seq)  # Increasing id keeps equal priorities in FIFO order
         queued_request = QueuedRequest(url=url, kwargs=kwargs, future=future, priority=priority)
 
-        try:
-            # Add to priority queue (priority, unique_id, request)
-            self._request_queue.put((priority, request_id, queued_request), block=False)
-            self._logger.debug(f"Queued request for {url} with priority {priority}")
-            return future
-        except queue.Full:
-            future.set_exception(queue.Full("Request queue is full"))
-            raise
+        # Work out when the request may be sent so workers never sleep while holding it
+        delay = self.calculate_delay(url)
+        if delay > 0:
+            queued_request.not_before = queued_request.queued_at + delay
+
+        with self._heap_cv:
+            if 0 < self.max_queue_size <= len(self._heap) + len(self._delayed):
+                error = queue.Full("Request queue is full")
+                future.set_exception(error)
+                raise error
+            if delay > 0:
+                heapq.heappush(self._delayed, (queued_request.not_before, priority, request_id, queued_request))
+            else:
+                # Add to priority heap (priority, unique_id, request)
+                heapq.heappush(self._heap, (priority, request_id, queued_request))
+            self._unfinished += 1
+            self._heap_cv.notify()
+
+        self._logger.debug("Queued request for %s with priority %s", url, priority)
+        return future
 
     def get_queue_status(self) -> Dict[str, Any]:
         """Get current queue status information"""
+        queue_size = len(self._heap) + len(self._delayed)
         return {
-            'queue_size': self._request_queue.qsize(),
+            'queue_size': queue_size,
             'max_queue_size': self.max_queue_size,
-            'queue_full': self._request_queue.full(),
-            'queue_empty': self._request_queue.empty()
+            'queue_full': 0 < self.max_queue_size <= queue_size,
+            'queue_empty': queue_size == 0
         }
 
     def update_rate_limit_info(self, url: str, response: requests.Response, token: Optional[str] = None) -> None:
@@ -458,36 +796,29 @@ class RateLimitManager:
             response: HTTP response object
             token: The API token used for this request (if any)
         """
-        endpoint_key = self._get_endpoint_key(url)
+        self._update_rate_limit_info_for_key(self._get_endpoint_key(url), response, token)
+
+    def _update_rate_limit_info_for_key(self, endpoint_key: str, response: requests.Response,
+                                        token: Optional[str] = None) -> None:
+        """update_rate_limit_info for an already-resolved endpoint key"""
         new_info = self.parse_headers(response)
         new_info.token = token
 
+        # Stored entries are never mutated: build the merged copy outside the lock and swap it
+        # in with one assignment, so readers always see a consistent snapshot
+        existing = self._rate_limits.get(endpoint_key)
+        merged = existing.merge(new_info) if existing is not None else new_info
         with self._lock:
-            if endpoint_key in self._rate_limits:
-                # Update existing info, preserving values that weren't in this response
-                existing = self._rate_limits[endpoint_key]
-                if new_info.limit is not None:
-                    existing.limit = new_info.limit
-                if new_info.remaining is not None:
-                    existing.remaining = new_info.remaining
-                if new_info.reset_time is not None:
-                    existing.reset_time = new_info.reset_time
-                if new_info.cache_control_ttl is not None:
-                    existing.cache_control_ttl = new_info.cache_control_ttl
-                if new_info.expires is not None:
-                    existing.expires = new_info.expires
-                if new_info.api_version is not None:
-                    existing.api_version = new_info.api_version
-                if new_info.token is not None:
-                    existing.token = new_info.token
-                existing.last_request_time = new_info.last_request_time
-            else:
-                # Store new rate limit info
-                self._rate_limits[endpoint_key] = new_info
+            current = self._rate_limits.get(endpoint_key)
+            if current is not existing:
+                # A reset or another response replaced the entry meanwhile; merge against what is
+                # stored now so a reset entry is not resurrected
+                merged = current.merge(new_info) if current is not None else new_info
+            self._rate_limits[endpoint_key] = merged
 
         # Update token manager if we have one and this is a Wynncraft API
         if (self.token_manager and token and
-            endpoint_key in ['wynncraft_player_api', 'wynncraft_api_v3']):
+            endpoint_key in _WYNNCRAFT_ENDPOINTS):
             self.token_manager.update_token_rate_limit(token, new_info)
 
         # Log rate limit status
@@ -498,14 +829,14 @@ class RateLimitManager:
         if info.remaining is not None and info.limit is not None:
             percentage = (info.remaining / info.limit) * 100
             self._logger.info(
-                f"Rate limit status for {endpoint_key}: "
-                f"{info.remaining}/{info.limit} remaining ({percentage:.1f}%)"
+                "Rate limit status for %s: %s/%s remaining (%.1f%%)",
+                endpoint_key, info.remaining, info.limit, percentage
             )
 
             if info.should_throttle(self.throttle_threshold):
                 self._logger.warning(
-                    f"Rate limit threshold reached for {endpoint_key}. "
-                    f"Throttling enabled. Reset in {info.seconds_until_reset()}s"
+                    "Rate limit threshold reached for %s. Throttling enabled. Reset in %ss",
+                    endpoint_key, info.seconds_until_reset(info.last_request_monotonic)
                 )
 
     def get_rate_limit_info(self, url: str) -> Optional[RateLimitInfo]:
@@ -518,9 +849,15 @@ class RateLimitManager:
         Returns:
             RateLimitInfo object or None if no info available
         """
-        endpoint_key = self._get_endpoint_key(url)
-        with self._lock:
-            return self._rate_limits.get(endpoint_key)
+        return self._snapshot(self._get_endpoint_key(url))
+
+    def _snapshot(self, endpoint_key: str) -> Optional[RateLimitInfo]:
+        """Current RateLimitInfo for an endpoint.
+
+        Entries are replaced copy-on-write and never mutated, so a single unlocked dict
+        read is a consistent snapshot that can be passed around instead of re-read.
+        """
+        return self._rate_limits.get(endpoint_key)
 
     def calculate_delay(self, url: str) -> float:
         """
@@ -532,30 +869,60 @@ class RateLimitManager:
         Returns:
             Delay in seconds
         """
-        endpoint_key = self._get_endpoint_key(url)
+        return self._calculate_delay_for_key(self._get_endpoint_key(url))
 
-        with self._lock:
-            # If we have multiple API tokens and at least one is available, do not delay
-            if endpoint_key in ['wynncraft_player_api', 'wynncraft_api_v3'] and self.token_manager:
-                if self.token_manager.has_available_token():
-                    return 0.0
+    def _calculate_delay_for_key(self, endpoint_key: str) -> float:
+        """calculate_delay for an already-resolved endpoint key"""
+        return self._compute_delay_from(endpoint_key, self._snapshot(endpoint_key))
 
-            if endpoint_key not in self._rate_limits:
+    def _compute_delay_from(self, endpoint_key: str, info: Optional[RateLimitInfo]) -> float:
+        """Delay needed before the next request, given a snapshot of the endpoint's info"""
+        # Without header-based quota info fall back to the client-side cap
+        if info is None or info.remaining is None:
+            return self._client_side_delay(endpoint_key)
+
+        # If we have multiple API tokens and at least one is available, do not delay
+        if endpoint_key in _WYNNCRAFT_ENDPOINTS and self.token_manager:
+            if self.token_manager.has_available_token():
                 return 0.0
 
-            info = self._rate_limits[endpoint_key]
+        # If we're rate limited, wait until reset
+        now = time.monotonic()
+        if info.is_rate_limited(now):
+            delay = info.seconds_until_reset(now)
+            self._logger.warning(
+                "Rate limited for %s. Waiting %ss until reset.", endpoint_key, delay
+            )
+            return delay
 
-            # If we're rate limited, wait until reset
-            if info.is_rate_limited():
-                delay = info.seconds_until_reset()
-                self._logger.warning(
-                    f"Rate limited for {endpoint_key}. Waiting {delay}s until reset."
-                )
-                return delay
+        # Remove throttle-based delays; proceed without delay until actually rate limited
+        return 0.0
 
-            # Remove throttle-based delays; proceed without delay until actually rate limited
+    def _get_bucket(self, endpoint_key: str) -> Optional[TokenBucket]:
+        """Get the pacing bucket for an endpoint, creating it on first use"""
+        bucket = self._buckets.get(endpoint_key, False)
+        if bucket is not False:
+            return bucket
+
+        with self._lock:
+            if endpoint_key not in self._buckets:
+                cap = self.config.get_api_settings(endpoint_key).get('requests_per_minute', 0)
+                self._buckets[endpoint_key] = TokenBucket(cap) if cap > 0 else None
+            return self._buckets[endpoint_key]
+
+    def _client_side_delay(self, endpoint_key: str) -> float:
+        """Delay needed to stay under the configured requests_per_minute cap for an endpoint"""
+        bucket = self._get_bucket(endpoint_key)
+        if bucket is None:
             return 0.0
 
+        delay = bucket.time_until_available()
+        if delay > 0:
+            self._logger.info(
+                "Client-side limit of %s/min reached for %s. Waiting %.1fs.", bucket.rate_per_min, endpoint_key, delay
+            )
+        return delay
+
     def is_cache_valid(self, url: str) -> bool:
         """
         Check if cached data for this endpoint is still valid based on cache headers.
@@ -566,34 +933,86 @@ class RateLimitManager:
         Returns:
             True if cache is still valid, False otherwise
         """
-        endpoint_key = self._get_endpoint_key(url)
+        return self._is_cache_valid_for(self._rate_limits.get(self._get_endpoint_key(url)))
 
-        with self._lock:
-            if endpoint_key not in self._rate_limits:
-                return False
-
-            info = self._rate_limits[endpoint_key]
-            now = datetime.now()
+    @staticmethod
+    def _is_cache_valid_for(info: Optional[RateLimitInfo]) -> bool:
+        """Check cache validity against an already looked-up RateLimitInfo"""
+        if info is None:
+            return False
 
-            # Check Expires header
-            if info.expires and now < info.expires:
+        # Check Cache-Control max-age
+        if info.cache_control_ttl and info.last_request_monotonic is not None:
+            if time.monotonic() < info.last_request_monotonic + info.cache_control_ttl:
                 return True
 
-            # Check Cache-Control max-age
-            if info.cache_control_ttl and info.last_request_time:
-                cache_expires = info.last_request_time + timedelta(seconds=info.cache_control_ttl)
-                if now < cache_expires:
-                    return True
+        # Check Expires header
+        if info.expires and datetime.now() < info.expires:
+            return True
 
-            return False
+        return False
+
+    def _response_cache_key(self, url: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a GET request, or None if its response must not be cached"""
+        if self.response_cache_size <= 0 or not _UNCACHEABLE_KWARGS.isdisjoint(kwargs):
+            return None
+        params = kwargs.get('params')
+        if params is None:
+            return url
+        if isinstance(params, dict):
+            return f"{url}#{sorted(params.items())!r}"
+        return None
+
+    def _get_cached_response(self, cache_key: Optional[str], allow_stale: bool = False) -> Optional[requests.Response]:
+        """Return a cached response that is still fresh (or any cached one if allow_stale)"""
+        if cache_key is None:
+            return None
+        with self._response_cache_lock:
+            entry = self._response_cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if not allow_stale and time.monotonic() >= expires_at:
+                return None
+            self._response_cache.move_to_end(cache_key)
+            return response
+
+    def _store_response(self, cache_key: Optional[str], endpoint_key: str, response: requests.Response) -> None:
+        """Cache a successful response for its Cache-Control max-age (or the endpoint's fallback TTL)"""
+        if cache_key is None or response.status_code != 200:
+            return
+        headers = response.headers
+        if headers.get(_SET_COOKIE_HEADER) is not None:
+            return
+
+        cache_control = headers.get(_CACHE_CONTROL_HEADER)
+        if cache_control is None:
+            ttl = _FALLBACK_CACHE_TTL.get(endpoint_key)
+        elif 'no-store' in cache_control or 'no-cache' in cache_control:
+            return
+        else:
+            ttl = _parse_max_age(cache_control)
+            if ttl is None:
+                ttl = _FALLBACK_CACHE_TTL.get(endpoint_key)
+        if not ttl:
+            return
 
-    def make_request(self, url: str, max_retries: int = 3, **kwargs) -> requests.Response:
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = (time.monotonic() + ttl, response)
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def make_request(self, url: str, max_retries: int = 3, allow_stale: bool = False,
+                     **kwargs) -> requests.Response:
         """
         Make an HTTP request with intelligent rate limiting and retry logic.
 
         Args:
             url: URL to request
             max_retries: Maximum number of retries for non-rate-limit errors
+            allow_stale: Return an expired cached response instead of a 5xx response or
+                raising once retries are exhausted (only if response caching is enabled)
             **kwargs: Additional arguments to pass to requests.get()
 
         Returns:
@@ -603,13 +1022,22 @@ class RateLimitManager:
             requests.RequestException: If request fails after retries
         """
         last_exception = None
+        # Resolve the endpoint once; timeouts, auth, delay and header bookkeeping below reuse it
+        endpoint_key = self._get_endpoint_key(url)
+
+        # Serve from the response cache while the upstream's max-age allows it
+        cache_key = self._response_cache_key(url, kwargs)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            self._logger.debug("Serving cached response for %s", url)
+            return cached
 
         # Get timeout settings for this endpoint
-        connect_timeout, request_timeout = self._get_timeout_settings(url)
+        connect_timeout, request_timeout = self._get_timeout_settings_for_key(endpoint_key)
         timeout = (connect_timeout, request_timeout)
 
         # Get authorization headers
-        auth_headers = self._get_auth_headers(url)
+        auth_headers = self._get_auth_headers_for_key(endpoint_key)
         current_token = None
         if 'Authorization' in auth_headers:
             # Extract token from Bearer header for tracking
@@ -623,27 +1051,34 @@ class RateLimitManager:
 
         for attempt in range(max_retries + 1):
             try:
-                # Calculate and apply delay
-                delay = self.calculate_delay(url)
+                # Calculate and apply delay from one snapshot of the endpoint's rate limit info
+                delay = self._compute_delay_from(endpoint_key, self._snapshot(endpoint_key))
                 if delay > 0:
-                    self._logger.info(f"Applying delay of {delay:.2f}s before request to {url}")
+                    self._logger.info("Applying delay of %.2fs before request to %s", delay, url)
                     time.sleep(delay)
 
+                # Pace to the configured requests_per_minute, if any
+                bucket = self._get_bucket(endpoint_key)
+                if bucket is not None:
+                    waited = bucket.acquire()
+                    if waited > 0:
+                        self._logger.debug("Paced request to %s by %.2fs", url, waited)
+
                 # Make the request with timeout
-                self._logger.debug(f"Making request to {url} with timeout {timeout}")
+                self._logger.debug("Making request to %s with timeout %s", url, timeout)
                 if current_token:
-                    self._logger.debug(f"Using token {current_token[:8]}... for request")
+                    self._logger.debug("Using token %.8s... for request", current_token)
 
-                response = requests.get(url, timeout=timeout, **kwargs)
+                response = self._session.get(url, timeout=timeout, **kwargs)
 
                 # Update rate limit information from response headers
-                self.update_rate_limit_info(url, response, current_token)
+                self._update_rate_limit_info_for_key(endpoint_key, response, current_token)
 
-                # Handle rate limiting with automatic retry
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 5))
+                # Handle rate limiting by retrying through the loop (the last 429 is returned as-is)
+                if response.status_code == 429 and attempt < max_retries:
+                    retry_after = _parse_retry_after(response.headers.get(_RETRY_AFTER_HEADER))
                     self._logger.warning(
-                        f"Rate limited (429) for {url}. Retrying after {retry_after}s"
+                        "Rate limited (429) for %s. Retrying after %ss", url, retry_after
                     )
 
                     rotated = False
@@ -651,35 +1086,43 @@ class RateLimitManager:
                     if self.token_manager:
                         new_token = self.token_manager.get_available_token()
                         if new_token and new_token != current_token:
-                            self._logger.info(f"Rotating from token {current_token[:8] + '...' if current_token else ''} to {new_token[:8]}...")
-                            kwargs['headers']['Authorization'] = f'Bearer {new_token}'
+                            self._logger.info("Rotating from token %.8s... to %.8s...", current_token or '', new_token)
+                            kwargs['headers'].update(self.token_manager.auth_headers[new_token])
                             current_token = new_token
                             rotated = True
 
                     # Only wait if we could not rotate to a different available token
                     if not rotated:
                         time.sleep(retry_after)
+                    continue
 
-                    # Update our rate limit info and try again
-                    self.update_rate_limit_info(url, response, current_token)
-                    response = requests.get(url, timeout=timeout, **kwargs)
-                    self.update_rate_limit_info(url, response, current_token)
+                if response.status_code >= 500:
+                    # Upstream error: fall back to a stale cached copy if the caller accepts one
+                    stale = self._get_cached_response(cache_key, allow_stale=True) if allow_stale else None
+                    if stale is not None:
+                        self._logger.warning("Upstream error %s for %s, serving stale cached response", response.status_code, url)
+                        return stale
 
+                self._store_response(cache_key, endpoint_key, response)
                 return response
 
             except requests.Timeout as e:
                 last_exception = e
                 self._logger.error(
-                    f"Request to {url} timed out after {request_timeout}s "
-                    f"(attempt {attempt + 1}/{max_retries + 1}): {e}"
+                    "Request to %s timed out after %ss (attempt %d/%d): %s",
+                    url, request_timeout, attempt + 1, max_retries + 1, e
                 )
                 if attempt < max_retries:
                     # For timeouts, use a shorter backoff delay
                     backoff_delay = min(5.0, (2 ** attempt))  # Cap at 5 seconds for timeouts
-                    self._logger.warning(f"Retrying in {backoff_delay:.1f}s")
+                    self._logger.warning("Retrying in %.1fs", backoff_delay)
                     time.sleep(backoff_delay)
                 else:
-                    self._logger.error(f"Request timed out after {max_retries + 1} attempts")
+                    self._logger.error("Request timed out after %d attempts", max_retries + 1)
+                    stale = self._get_cached_response(cache_key, allow_stale=True) if allow_stale else None
+                    if stale is not None:
+                        self._logger.warning("Serving stale cached response for %s", url)
+                        return stale
                     raise e
             except requests.RequestException as e:
                 last_exception = e
@@ -687,12 +1130,16 @@ class RateLimitManager:
                     # Exponential backoff for retries
                     backoff_delay = (2 ** attempt) + (attempt * 0.1)  # 1s, 2.1s, 4.2s, etc.
                     self._logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
-                        f"Retrying in {backoff_delay:.1f}s"
+                        "Request failed (attempt %d/%d): %s. Retrying in %.1fs",
+                        attempt + 1, max_retries + 1, e, backoff_delay
                     )
                     time.sleep(backoff_delay)
                 else:
-                    self._logger.error(f"Request failed after {max_retries + 1} attempts: {e}")
+                    self._logger.error("Request failed after %d attempts: %s", max_retries + 1, e)
+                    stale = self._get_cached_response(cache_key, allow_stale=True) if allow_stale else None
+                    if stale is not None:
+                        self._logger.warning("Serving stale cached response for %s", url)
+                        return stale
                     raise e
 
         # This should never be reached, but just in case
@@ -708,29 +1155,14 @@ class RateLimitManager:
         Returns:
             Dictionary with rate limit status for each endpoint
         """
-        summary = {}
+        # Entries are replaced copy-on-write and list(dict.items()) is atomic under the GIL, so
+        # this shallow snapshot is consistent without taking the lock
+        items = list(self._rate_limits.items())
 
-        with self._lock:
-            for endpoint_key, info in self._rate_limits.items():
-                # Mask token for security if present
-                masked_token = None
-                if info.token:
-                    masked_token = f"{info.token[:8]}...{info.token[-4:]}" if len(info.token) > 12 else "***"
-
-                summary[endpoint_key] = {
-                    'limit': info.limit,
-                    'remaining': info.remaining,
-                    'reset_time': info.reset_time.isoformat() if info.reset_time else None,
-                    'seconds_until_reset': info.seconds_until_reset(),
-                    'is_rate_limited': info.is_rate_limited(),
-                    'should_throttle': info.should_throttle(self.throttle_threshold),
-                    'cache_control_ttl': info.cache_control_ttl,
-                    'expires': info.expires.isoformat() if info.expires else None,
-                    'api_version': info.api_version,
-                    'last_request_time': info.last_request_time.isoformat() if info.last_request_time else None,
-                    'cache_valid': self.is_cache_valid(endpoint_key),
-                    'current_token': masked_token
-                }
+        # Read the clocks once for every entry
+        now = time.monotonic()
+        base = _wall_clock_base()
+        summary = {endpoint_key: self._serialize_info(info, now, base) for endpoint_key, info in items}
 
         # Add token manager status if available
         if self.token_manager:
@@ -738,6 +1170,30 @@ class RateLimitManager:
 
         return summary
 
+    def _serialize_info(self, info: RateLimitInfo, now: float, base: datetime) -> Dict[str, Any]:
+        """Status dictionary for one endpoint (now/base: clock readings shared by the whole summary)"""
+        # Stored entries are never mutated, so their fixed fields are serialized only once
+        static = info._summary
+        if static is None:
+            static = info._summary = {
+                'limit': info.limit,
+                'remaining': info.remaining,
+                'reset_time': _monotonic_to_iso(info.reset_monotonic, base),
+                'cache_control_ttl': info.cache_control_ttl,
+                'expires': info.expires.isoformat() if info.expires else None,
+                'api_version': info.api_version,
+                'last_request_time': _monotonic_to_iso(info.last_request_monotonic, base),
+                # Mask token for security if present
+                'current_token': _mask_token(info.token) if info.token else None
+            }
+        return {
+            **static,
+            'seconds_until_reset': info.seconds_until_reset(now),
+            'is_rate_limited': info.is_rate_limited(now),
+            'should_throttle': info.should_throttle(self.throttle_threshold),
+            'cache_valid': self._is_cache_valid_for(info),
+        }
+
     def reset_rate_limit_info(self, url: Optional[str] = None) -> None:
         """
         Reset rate limit information for a specific endpoint or all endpoints.
@@ -748,25 +1204,28 @@ class RateLimitManager:
         with self._lock:
             if url:
                 endpoint_key = self._get_endpoint_key(url)
+                self._buckets.pop(endpoint_key, None)
                 if endpoint_key in self._rate_limits:
                     del self._rate_limits[endpoint_key]
-                    self._logger.info(f"Reset rate limit info for {endpoint_key}")
+                    self._logger.info("Reset rate limit info for %s", endpoint_key)
             else:
                 self._rate_limits.clear()
+                self._buckets.clear()
                 self._logger.info("Reset all rate limit information")
 
     def shutdown(self) -> None:
         """Shutdown the rate limit manager and clean up resources"""
-        self._queue_running = False
-
-        # Wait for queue to be processed
-        try:
-            self._request_queue.join()
-        except:
-            pass
-
-        # Shutdown the executor
-        self._queue_executor.shutdown(wait=True)
+        # Wake idle workers and wait for queued requests to be processed
+        with self._heap_cv:
+            self._queue_running = False
+            self._heap_cv.notify_all()
+            while self._unfinished:
+                self._heap_cv.wait()
+
+        # Stop the workers and release pooled connections
+        for worker in self._workers:
+            worker.join()
+        self._session.close()
         self._logger.info("Rate limit manager shutdown complete")
 
     def __enter__(self):